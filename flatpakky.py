@@ -7,88 +7,313 @@ Enhanced version with improved features
 
 import sys
 import os
+import csv
 import json
+import codecs
+import hashlib
+import re
 import subprocess
 import threading
 import webbrowser
 import time
-from typing import Dict, List, Optional, Any
-from urllib.request import urlopen, Request
+from collections import OrderedDict, defaultdict, deque
+from functools import partial
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from urllib.parse import quote
-from urllib.error import URLError, HTTPError
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+# Optional: faster bytes-in JSON parsing (orjson, else jiter with key caching)
+try:
+    import orjson
+    fast_json_loads = orjson.loads
+except ImportError:
+    try:
+        import jiter
+        fast_json_loads = partial(jiter.from_json, cache_mode='keys')
+    except ImportError:
+        fast_json_loads = None
+try:
+    # Optional: in-process libflatpak, avoids forking flatpak for queries
+    import gi
+    gi.require_version('Flatpak', '1.0')
+    from gi.repository import Flatpak
+except (ImportError, ValueError):
+    Flatpak = None
+try:
+    # Optional: HTTP/2 client (needs httpx[http2]) for multiplexed icon downloads
+    import httpx
+except ImportError:
+    httpx = None
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QSplitter, QListWidget, QListWidgetItem, QLabel, QPushButton,
+    QSplitter, QListView, QListWidget, QListWidgetItem, QLabel, QPushButton,
     QLineEdit, QTextEdit, QProgressBar, QStatusBar, QFrame,
     QScrollArea, QGroupBox, QCheckBox, QMessageBox, QFileDialog,
     QTreeWidget, QTreeWidgetItem, QTabWidget, QGridLayout,
     QComboBox, QSpinBox, QDialog, QDialogButtonBox, QSystemTrayIcon,
     QMenu, QStyle, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl, QSize
-from PyQt6.QtGui import QPixmap, QIcon, QFont, QAction, QDesktopServices
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QUrl, QSize, QObject, QRunnable, QThreadPool, QProcess, QFileSystemWatcher
+from PyQt6.QtGui import QImage, QPixmap, QPixmapCache, QIcon, QPainter, QFont, QAction, QDesktopServices
 import tempfile
-import urllib.request
+import shutil
+
+# Resolved once at startup so every flatpak call skips the PATH search
+FLATPAK_BIN = shutil.which('flatpak')
+
+SCRIPT_PATH = os.path.abspath(__file__)
+
+# .desktop file for the .flatpakref MIME type association
+DESKTOP_FILE_CONTENT = f"""[Desktop Entry]
+Name=Flatpakky
+Comment=Flathub browser for Flatpaks
+Exec=python3 {SCRIPT_PATH} %F
+Icon=application-x-flatpakref
+Terminal=false
+Type=Application
+MimeType=application/vnd.flatpak.ref;
+Categories=System;PackageManager;
+"""
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after a fixed time"""
+    
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, timestamp = entry
+            if time.monotonic() - timestamp > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any):
+        """Store a value, evicting the least recently used entries"""
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._data.clear()
 
 class FlatpakAPI:
     """Handles communication with Flathub API and local Flatpak commands"""
     
+    # flatpak CLI errors for ids the remote doesn't have
+    unresolved_ref_pattern = re.compile(r'Nothing matches|No remote refs found|not found in remote', re.IGNORECASE)
+    
     def __init__(self):
         self.base_url = "https://flathub.org/api/v1"
-        self.apps_cache = {}
-        self.icons_cache = {}
+        self.apps_cache = TTLCache(ttl=300)
+        self.details_cache = TTLCache(ttl=300, maxsize=512)
         self.last_error = None
+        
+        # Shared keep-alive session so repeated Flathub hits skip the TLS handshake
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'Flatpakky/1.0'
+        # Few distinct hosts (flathub.org, dl.flathub.org), many connections each
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry)
+        self.session.mount('https://', adapter)
+        
+        # Icon bursts share one multiplexed HTTP/2 connection when httpx can speak it;
+        # otherwise they go through the pooled session like everything else
+        self.icon_session = self.session
+        if httpx is not None:
+            try:
+                self.icon_session = httpx.Client(
+                    http2=True,
+                    follow_redirects=True,  # requests follows redirects; httpx doesn't by default
+                    headers={'User-Agent': 'Flatpakky/1.0'},
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                    timeout=10
+                )
+            except ImportError as e:
+                print(f"HTTP/2 unavailable for icon downloads: {e}")
+        
+        # Long-lived libflatpak installations (user + system) for read-only queries
+        self.installations = []
+        if Flatpak is not None:
+            try:
+                self.installations = [
+                    Flatpak.Installation.new_user(None),
+                    *Flatpak.get_system_installations(None)
+                ]
+            except Exception as e:
+                print(f"Error opening Flatpak installations: {e}")
+    
+    def invalidate(self):
+        """Forget cached Flathub responses so the next lookups refetch"""
+        self.apps_cache.clear()
+        self.details_cache.clear()
     
-    def search_apps(self, query: str = "") -> List[Dict]:
-        """Search for apps on Flathub"""
+    @staticmethod
+    def iter_json_array(response: requests.Response, chunk_size: int = 65536):
+        """Yield the elements of a streamed JSON array one at a time"""
+        decoder = json.JSONDecoder()
+        text_decoder = codecs.getincrementaldecoder('utf-8')()
+        buffer = ''
+        started = False
+        eof = False
+        chunks = response.iter_content(chunk_size)
+        
+        while not eof:
+            chunk = next(chunks, None)
+            if chunk is None:
+                eof = True
+                buffer += text_decoder.decode(b'', final=True)
+            else:
+                buffer += text_decoder.decode(chunk)
+            
+            pos = 0
+            while True:
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                    pos += 1
+                if pos >= len(buffer):
+                    break
+                if not started:
+                    if buffer[pos] != '[':
+                        return  # Not an array, nothing to yield
+                    started = True
+                    pos += 1
+                    continue
+                if buffer[pos] == ']':
+                    return
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    break  # Element continues in the next chunk
+                # A number cut at the chunk boundary still decodes, so only trust
+                # the element once the ',' or ']' right after it has arrived
+                after = end
+                while after < len(buffer) and buffer[after] in ' \t\r\n':
+                    after += 1
+                if after >= len(buffer) or buffer[after] not in ',]':
+                    # The rest of a split number ('1' + '500.0') may still be on its way
+                    if not eof:
+                        break
+                    if after < len(buffer):
+                        raise ValueError(f"Expected ',' or ']' at offset {after} of JSON array")
+                pos = end
+                yield item
+            buffer = buffer[pos:]
+        
+        if started:
+            raise ValueError("Truncated JSON array")
+    
+    def search_apps(self, query: str = "") -> Tuple[List[Dict], Optional[str]]:
+        """Search for apps on Flathub, returning the apps and this call's error (if any)"""
+        cache_key = query.strip().lower()
+        cached = self.apps_cache.get(cache_key)
+        if cached is not None:
+            self.last_error = None
+            return cached, None
+        
         try:
             if query:
                 url = f"{self.base_url}/search/{quote(query)}"
             else:
                 url = f"{self.base_url}/apps"
             
-            req = Request(url, headers={'User-Agent': 'Flatpakky/1.0'})
-            with urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                self.last_error = None
-                return data if isinstance(data, list) else []
-        except (URLError, HTTPError, json.JSONDecodeError) as e:
+            with self.session.get(url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                if fast_json_loads is not None:
+                    # Parse the raw bytes directly, no intermediate str
+                    data = fast_json_loads(response.content)
+                    if not isinstance(data, list):
+                        data = []
+                else:
+                    # Stream the (multi-MB) catalog instead of buffering the whole body
+                    data = list(self.iter_json_array(response))
+            self.last_error = None
+            self.apps_cache.set(cache_key, data)
+            return data, None
+        except (requests.RequestException, ValueError) as e:
             self.last_error = str(e)
             print(f"Error searching apps: {e}")
-            return []
+            return [], str(e)
     
     def get_app_details(self, app_id: str) -> Dict:
         """Get detailed information about a specific app"""
+        cached = self.details_cache.get(app_id)
+        if cached is not None:
+            self.last_error = None
+            return cached
+        
         try:
             url = f"{self.base_url}/apps/{app_id}"
-            req = Request(url, headers={'User-Agent': 'Flatpakky/1.0'})
-            with urlopen(req, timeout=10) as response:
-                self.last_error = None
-                return json.loads(response.read().decode())
-        except (URLError, HTTPError, json.JSONDecodeError) as e:
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            data = fast_json_loads(response.content) if fast_json_loads is not None else response.json()
+            self.last_error = None
+            self.details_cache.set(app_id, data)
+            return data
+        except (requests.RequestException, ValueError) as e:
             self.last_error = str(e)
             print(f"Error getting app details: {e}")
             return {}
     
     def get_installed_apps(self) -> List[Dict]:
         """Get list of installed Flatpak applications"""
+        if self.installations:
+            try:
+                apps = [
+                    {
+                        'name': ref.get_appdata_name() or ref.get_name(),
+                        'flatpakAppId': ref.get_name(),
+                        'currentReleaseVersion': ref.get_appdata_version() or '',
+                        'branch': ref.get_branch(),
+                        'origin': ref.get_origin()
+                    }
+                    for installation in self.installations
+                    for ref in installation.list_installed_refs_by_kind(Flatpak.RefKind.APP, None)
+                ]
+                self.last_error = None
+                return apps
+            except Exception as e:
+                print(f"libflatpak query failed, falling back to flatpak CLI: {e}")
+        
         try:
-            result = subprocess.run(
-                ['flatpak', 'list', '--app', '--columns=name,application,version,branch,origin'],
-                capture_output=True, text=True, check=True
-            )
-            apps = []
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    parts = line.split('\t')
-                    if len(parts) >= 5:
-                        apps.append({
-                            'name': parts[0],
-                            'flatpakAppId': parts[1],
-                            'currentReleaseVersion': parts[2],
-                            'branch': parts[3],
-                            'origin': parts[4]
-                        })
+            # Parse rows straight off the pipe instead of buffering all of stdout;
+            # read raw bytes and decode only the fields that are kept
+            with subprocess.Popen(
+                [FLATPAK_BIN, 'list', '--app', '--columns=name,application,version,branch,origin'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            ) as proc:
+                apps = []
+                for raw in proc.stdout:
+                    row = raw.rstrip(b'\n').split(b'\t', 4)
+                    if len(row) < 5:
+                        continue
+                    name, app_id, version, branch, origin = (
+                        field.decode('utf-8', 'replace') for field in row
+                    )
+                    apps.append({
+                        'name': name,
+                        'flatpakAppId': app_id,
+                        'currentReleaseVersion': version,
+                        'branch': branch,
+                        'origin': origin
+                    })
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args)
             self.last_error = None
             return apps
         except Exception as e:
@@ -96,125 +321,457 @@ class FlatpakAPI:
             print(f"Error getting installed apps: {e}")
             return []
     
-    def install_app(self, app_id: str) -> bool:
-        """Install a Flatpak application"""
+    def run_flatpak(self, args: List[str], on_output: Optional[Callable[[str], None]] = None):
+        """Run a flatpak command, streaming its output lines to on_output"""
+        proc = subprocess.Popen(
+            [FLATPAK_BIN, *args],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+        last_line = ''
+        for line in proc.stdout:
+            line = line.strip()
+            if line:
+                last_line = line
+                if on_output:
+                    on_output(line)
+        if proc.wait() != 0:
+            # flatpak ends with its "error: ..." line; keep it for the caller
+            raise subprocess.CalledProcessError(proc.returncode, proc.args, output=last_line)
+    
+    def get_update_count(self) -> Optional[int]:
+        """Count available updates, or None if the check failed"""
+        if self.installations:
+            try:
+                updates = sum(
+                    len(installation.list_installed_refs_for_update(None))
+                    for installation in self.installations
+                )
+                self.last_error = None
+                return updates
+            except Exception as e:
+                print(f"libflatpak query failed, falling back to flatpak CLI: {e}")
+        
         try:
-            subprocess.run(
-                ['flatpak', 'install', 'flathub', app_id, '-y'],
-                check=True
+            result = subprocess.run(
+                [FLATPAK_BIN, 'remote-ls', '--updates'],
+                capture_output=True, check=True
             )
             self.last_error = None
-            return True
+            # One ref per line; count newlines in the raw bytes instead of splitting
+            return result.stdout.count(b'\n')
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"Error checking for updates: {e}")
+            return None
+    
+    def find_installation_with_remote(self, remote: str):
+        """Return the open installation that has the remote configured, or None"""
+        # Like the CLI, prefer system-wide installations over the per-user one
+        for installation in self.installations[1:] + self.installations[:1]:
+            try:
+                installation.get_remote_by_name(remote, None)
+                return installation
+            except Exception:
+                continue
+        return None
+    
+    def create_install_transaction(self, app_ids: List[str], on_output: Optional[Callable[[str], None]] = None):
+        """Prepare an in-process libflatpak install from Flathub, or None if unavailable"""
+        installation = self.find_installation_with_remote('flathub')
+        if installation is None:
+            return None
+        try:
+            transaction = Flatpak.Transaction.new_for_installation(installation, None)
+            transaction.add_default_dependency_sources()
+            arch = Flatpak.get_default_arch()
+            for app_id in app_ids:
+                transaction.add_install('flathub', f'app/{app_id}/{arch}/stable', None)
+        except Exception as e:
+            print(f"libflatpak transaction unavailable, falling back to flatpak CLI: {e}")
+            return None
+        
+        def on_new_operation(transaction, operation, progress):
+            # Report progress in the CLI's "<ref> 42%" shape so AppWorker parses it
+            ref = operation.get_ref()
+            if on_output:
+                on_output(f"Installing {ref}")
+                progress.set_update_frequency(500)
+                progress.connect('changed', lambda p: on_output(f"Installing {ref} {p.get_progress()}%"))
+        
+        transaction.connect('new-operation', on_new_operation)
+        return transaction
+    
+    def install_app(self, app_id: str, on_output: Optional[Callable[[str], None]] = None) -> Tuple[bool, Optional[str]]:
+        """Install a Flatpak application, returning success and this call's error (if any)"""
+        try:
+            transaction = self.create_install_transaction([app_id], on_output)
+            if transaction is not None:
+                transaction.run(None)
+            else:
+                self.run_flatpak(['install', 'flathub', app_id, '-y'], on_output)
+            self.last_error = None
+            return True, None
         except Exception as e:
             self.last_error = str(e)
             print(f"Error installing app: {e}")
-            return False
+            return False, str(e)
     
-    def uninstall_app(self, app_id: str) -> bool:
-        """Uninstall a Flatpak application"""
+    def is_unresolved_ref(self, error: Exception) -> bool:
+        """Whether an install failed only because a ref couldn't be found on the remote"""
+        if isinstance(error, subprocess.CalledProcessError):
+            return bool(error.output and self.unresolved_ref_pattern.search(error.output))
+        if Flatpak is not None and getattr(error, 'domain', None) == 'flatpak-error-quark':
+            # REF_NOT_FOUND only exists in newer libflatpak
+            return error.code in {getattr(Flatpak.Error, name, None) for name in ('REF_NOT_FOUND', 'INVALID_REF')}
+        return False
+    
+    def run_batch_install(self, app_ids: List[str], on_output: Optional[Callable[[str], None]] = None):
+        """Install from Flathub without prompting, raising if the transaction fails"""
+        transaction = self.create_install_transaction(app_ids, on_output)
+        if transaction is not None:
+            transaction.run(None)
+        else:
+            self.run_flatpak(['install', '--noninteractive', '-y', 'flathub', *app_ids], on_output)
+    
+    def install_apps(self, app_ids: List[str], on_output: Optional[Callable[[str], None]] = None) -> Tuple[List[str], Optional[str]]:
+        """Install several Flatpak applications in a single transaction, returning the ids that failed and the error"""
         try:
-            subprocess.run(
-                ['flatpak', 'uninstall', app_id, '-y'],
-                check=True
-            )
+            self.run_batch_install(app_ids, on_output)
+            self.last_error = None
+            return [], None
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"Error installing apps: {e}")
+            # An aborted or denied authorization, or a network failure, would only
+            # prompt or fail again for every id, so only missing refs are retried
+            if len(app_ids) < 2 or not self.is_unresolved_ref(e):
+                return list(app_ids), str(e)
+        
+        # A single unresolvable ref aborts the whole batch; retry the ids one by one
+        # so the rest still get installed (ones already done are skipped by flatpak)
+        failed = []
+        for index, app_id in enumerate(app_ids):
+            try:
+                self.run_batch_install([app_id], on_output)
+            except Exception as e:
+                print(f"Error installing {app_id}: {e}")
+                failed.append(app_id)
+                if not self.is_unresolved_ref(e):
+                    failed.extend(app_ids[index + 1:])
+                    break
+        error = f"Failed to install: {', '.join(failed)}" if failed else None
+        self.last_error = error
+        return failed, error
+    
+    def uninstall_app(self, app_id: str, on_output: Optional[Callable[[str], None]] = None) -> Tuple[bool, Optional[str]]:
+        """Uninstall a Flatpak application, returning success and this call's error (if any)"""
+        try:
+            self.run_flatpak(['uninstall', app_id, '-y'], on_output)
             self.last_error = None
-            return True
+            return True, None
         except Exception as e:
             self.last_error = str(e)
             print(f"Error uninstalling app: {e}")
-            return False
+            return False, str(e)
     
-    def update_app(self, app_id: str) -> bool:
-        """Update a specific Flatpak application"""
+    def update_app(self, app_id: str, on_output: Optional[Callable[[str], None]] = None) -> Tuple[bool, Optional[str]]:
+        """Update a specific Flatpak application, returning success and this call's error (if any)"""
         try:
-            subprocess.run(
-                ['flatpak', 'update', app_id, '-y'],
-                check=True
-            )
+            self.run_flatpak(['update', app_id, '-y'], on_output)
             self.last_error = None
-            return True
+            return True, None
         except Exception as e:
             self.last_error = str(e)
             print(f"Error updating app: {e}")
-            return False
+            return False, str(e)
     
-    def update_all_apps(self) -> bool:
-        """Update all Flatpak applications"""
+    def update_all_apps(self, on_output: Optional[Callable[[str], None]] = None) -> Tuple[bool, Optional[str]]:
+        """Update all Flatpak applications, returning success and this call's error (if any)"""
         try:
-            subprocess.run(
-                ['flatpak', 'update', '-y'],
-                check=True
-            )
+            self.run_flatpak(['update', '-y'], on_output)
             self.last_error = None
-            return True
+            return True, None
         except Exception as e:
             self.last_error = str(e)
             print(f"Error updating all apps: {e}")
-            return False
+            return False, str(e)
 
-class IconLoader(QThread):
-    """Thread for loading app icons"""
-    icon_loaded = pyqtSignal(str, QPixmap)
+class IconLoaderSignals(QObject):
+    """Signals shared by IconLoader tasks (QRunnable cannot emit itself)"""
+    icon_loaded = pyqtSignal(str, QImage)  # QPixmap may only be built on the GUI thread
     icon_failed = pyqtSignal(str)
+
+class IconLoader(QRunnable):
+    """Thread pool task for loading a single app icon"""
+    
+    # Cap on icon fetches in flight; further ones wait in the pool's queue.
+    # Stays under the 20-connection limit of both the requests and httpx clients
+    max_workers = 16
+    
+    # On-disk icon cache, reused across restarts
+    cache_dir = os.path.join(
+        os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'flatpakky', 'icons'
+    )
+    cache_max_age = 7 * 24 * 3600  # Revalidate cached icons after a week
+    
+    # Decoded, already scaled icons keyed by URL, shared by all listings
+    scaled_cache = TTLCache(ttl=cache_max_age, maxsize=512)
     
-    def __init__(self, app_id: str, icon_url: str):
+    # Set on shutdown; running loaders bail out between download and decode
+    cancelled = threading.Event()
+    
+    # Icons are a few KB; a short timeout also bounds how long quitting waits
+    # for downloads still in flight
+    timeout = 3
+    
+    def __init__(self, app_id: str, icon_url: str, session: Any, signals: IconLoaderSignals):
         super().__init__()
         self.app_id = app_id
         self.icon_url = icon_url
+        self.session = session
+        self.signals = signals
     
-    def run(self):
+    @classmethod
+    def cache_path(cls, icon_url: str) -> str:
+        """Path of the cached file for an icon URL"""
+        # Keyed by URL so a changed icon URL never serves a stale file
+        key = hashlib.sha1(icon_url.encode()).hexdigest()
+        return os.path.join(cls.cache_dir, f"{key}.png")
+    
+    @classmethod
+    def write_cache_file(cls, path: str, data: bytes):
+        """Replace a cache file in one step so concurrent readers never see it half-written"""
+        tmp = tempfile.NamedTemporaryFile(dir=cls.cache_dir, suffix='.tmp', delete=False)
         try:
-            req = Request(self.icon_url, headers={'User-Agent': 'Flatpakky/1.0'})
-            with urlopen(req, timeout=10) as response:
-                data = response.read()
-                pixmap = QPixmap()
-                pixmap.loadFromData(data)
-                if not pixmap.isNull():
-                    pixmap = pixmap.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    self.icon_loaded.emit(self.app_id, pixmap)
-                else:
-                    self.icon_failed.emit(self.app_id)
+            with tmp:
+                tmp.write(data)
+            os.replace(tmp.name, path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+    
+    @classmethod
+    def forget_etag(cls, icon_url: str):
+        """Drop the ETag sidecar so a broken cached copy is downloaded again in full"""
+        try:
+            os.remove(cls.cache_path(icon_url) + '.etag')
+        except OSError:
+            pass
+    
+    @classmethod
+    def load_cached(cls, icon_url: str) -> Optional[QImage]:
+        """Decode the on-disk copy if it is fresh enough, otherwise None"""
+        path = cls.cache_path(icon_url)
+        try:
+            if time.time() - os.path.getmtime(path) > cls.cache_max_age:
+                return None
+        except OSError:
+            return None
+        
+        image = QImage(path)
+        if image.isNull():
+            cls.forget_etag(icon_url)
+            return None
+        image = image.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        cls.scaled_cache.set(icon_url, image)
+        return image
+    
+    def fetch_icon(self) -> Optional[bytes]:
+        """Download raw icon bytes, returning None on failure"""
+        path = self.cache_path(self.icon_url)
+        etag_path = path + '.etag'
+        try:
+            # Revalidate a stale cached copy instead of downloading it again
+            headers = {}
+            if os.path.exists(path) and os.path.exists(etag_path):
+                with open(etag_path) as f:
+                    headers['If-None-Match'] = f.read().strip()
+            
+            # Works with both requests.Session and httpx.Client
+            response = self.session.get(self.icon_url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                os.utime(path)
+                with open(path, 'rb') as f:
+                    return f.read()
+            
+            response.raise_for_status()
+            data = response.content
+            
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.write_cache_file(path, data)
+            etag = response.headers.get('ETag')
+            if etag:
+                self.write_cache_file(etag_path, etag.encode())
+            return data
         except Exception as e:
-            print(f"Error loading icon for {self.app_id}: {e}")
-            self.icon_failed.emit(self.app_id)
+            if not self.cancelled.is_set():  # Closing the session on quit fails requests in flight
+                print(f"Error loading icon for {self.app_id}: {e}")
+            return None
+    
+    def run(self):
+        if self.cancelled.is_set():
+            return
+        
+        # Memory, then disk; both are checked here so decoding stays off the GUI thread
+        image = self.scaled_cache.get(self.icon_url)
+        if image is None:
+            image = self.load_cached(self.icon_url)
+        if image is not None:
+            self.signals.icon_loaded.emit(self.app_id, image)
+            return
+        
+        data = self.fetch_icon()
+        if self.cancelled.is_set():
+            return
+        # Decode and scale here in parallel; QImage, unlike QPixmap, is safe off the GUI thread
+        image = QImage.fromData(data) if data is not None else QImage()
+        if not image.isNull():
+            image = image.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            self.scaled_cache.set(self.icon_url, image)
+            self.signals.icon_loaded.emit(self.app_id, image)
+        else:
+            if data is not None:
+                # Otherwise a broken copy keeps being revalidated with a 304 forever
+                self.forget_etag(self.icon_url)
+            self.signals.icon_failed.emit(self.app_id)
 
-class AppWorker(QThread):
-    """Worker thread for app operations"""
-    operation_finished = pyqtSignal(bool, str)
+class AppWorkerSignals(QObject):
+    """Signals emitted by AppWorker"""
+    operation_finished = pyqtSignal(bool, str, list, list, str)  # success, operation, app ids, failed ids, error
     progress_updated = pyqtSignal(str)
+    progress_percent = pyqtSignal(int)
+    batch_progress = pyqtSignal(int, int, str)  # current, total, app id
+
+class AppWorker(QRunnable):
+    """Thread pool task for app operations"""
+    
+    # Matches the percentage in flatpak's "Installing 1/2… 42%" lines
+    percent_pattern = re.compile(r'(\d{1,3})%')
     
-    def __init__(self, operation: str, app_id: str, api: FlatpakAPI):
+    def __init__(self, operation: str, app_id: str, api: FlatpakAPI, app_ids: Optional[List[str]] = None):
         super().__init__()
+        self.signals = AppWorkerSignals()
         self.operation = operation
         self.app_id = app_id
         self.api = api
+        self.app_ids = app_ids or []
+        self.started_ids = set()
+        # Whole-id matches only, so org.foo doesn't fire on org.foo.Plugin lines
+        self.id_patterns = {
+            app_id: re.compile(rf'(?<![\w.-]){re.escape(app_id)}(?![\w.-])') for app_id in self.app_ids
+        }
+    
+    def report_output(self, line: str):
+        """Forward a flatpak output line, extracting any progress percentage"""
+        if self.operation == "install_batch":
+            # Batches report which app is underway rather than one ref's percentage
+            for app_id in self.app_ids:
+                if app_id not in self.started_ids and self.id_patterns[app_id].search(line):
+                    self.started_ids.add(app_id)
+                    self.signals.batch_progress.emit(len(self.started_ids), len(self.app_ids), app_id)
+        else:
+            match = self.percent_pattern.search(line)
+            if match:
+                self.signals.progress_percent.emit(min(int(match.group(1)), 100))
+        self.signals.progress_updated.emit(line)
+    
+    def finish(self, success: bool, error: Optional[str] = None, failed: Optional[List[str]] = None):
+        """Report the outcome along with the ids and error it concerns"""
+        app_ids = self.app_ids or ([self.app_id] if self.app_id else [])
+        if failed is None:
+            failed = [] if success else app_ids
+        # The error travels with the signal; api.last_error is shared with other pool tasks
+        self.signals.operation_finished.emit(success, self.operation, app_ids, failed, error or "")
     
     def run(self):
         try:
             if self.operation == "install":
-                self.progress_updated.emit(f"Installing {self.app_id}...")
-                success = self.api.install_app(self.app_id)
-                self.operation_finished.emit(success, "install")
+                self.signals.progress_updated.emit(f"Installing {self.app_id}...")
+                self.finish(*self.api.install_app(self.app_id, self.report_output))
+            elif self.operation == "install_batch":
+                self.signals.progress_updated.emit(f"Installing {len(self.app_ids)} applications...")
+                failed, error = self.api.install_apps(self.app_ids, self.report_output)
+                self.finish(not failed, error, failed)
             elif self.operation == "uninstall":
-                self.progress_updated.emit(f"Uninstalling {self.app_id}...")
-                success = self.api.uninstall_app(self.app_id)
-                self.operation_finished.emit(success, "uninstall")
+                self.signals.progress_updated.emit(f"Uninstalling {self.app_id}...")
+                self.finish(*self.api.uninstall_app(self.app_id, self.report_output))
             elif self.operation == "update":
-                self.progress_updated.emit(f"Updating {self.app_id}...")
-                success = self.api.update_app(self.app_id)
-                self.operation_finished.emit(success, "update")
+                self.signals.progress_updated.emit(f"Updating {self.app_id}...")
+                self.finish(*self.api.update_app(self.app_id, self.report_output))
             elif self.operation == "update_all":
-                self.progress_updated.emit("Updating all applications...")
-                success = self.api.update_all_apps()
-                self.operation_finished.emit(success, "update_all")
+                self.signals.progress_updated.emit("Updating all applications...")
+                self.finish(*self.api.update_all_apps(self.report_output))
         except Exception as e:
-            self.operation_finished.emit(False, self.operation)
+            self.finish(False, str(e))
+
+class FlatpakQuerySignals(QObject):
+    """Signals emitted by FlatpakQuery"""
+    finished = pyqtSignal(object)
+
+class FlatpakQuery(QRunnable):
+    """Thread pool task running a blocking FlatpakAPI query off the GUI thread"""
+    
+    def __init__(self, query: Callable[[], Any]):
+        super().__init__()
+        self.signals = FlatpakQuerySignals()
+        self.query = query
+    
+    def run(self):
+        self.signals.finished.emit(self.query())
+
+class AppsLoaderSignals(QObject):
+    """Signals emitted by AppsLoader"""
+    apps_loaded = pyqtSignal(int, str, list)
+    apps_failed = pyqtSignal(int, str)
+
+class AppsLoader(QRunnable):
+    """Thread pool task fetching a Flathub app listing"""
+    
+    def __init__(self, query: str, api: FlatpakAPI, token: int = 0):
+        super().__init__()
+        self.signals = AppsLoaderSignals()
+        self.query = query
+        self.api = api
+        self.token = token
+    
+    def run(self):
+        # The error comes back with the result; the shared last_error may be
+        # overwritten by other pool tasks at any time
+        apps, error = self.api.search_apps(self.query)
+        if error:
+            self.signals.apps_failed.emit(self.token, error)
+        else:
+            self.signals.apps_loaded.emit(self.token, self.query, apps)
+
+class PendingInstallQueue(QObject):
+    """Collects .flatpakref files opened in quick succession into one install"""
+    ready = pyqtSignal(list)
+    
+    def __init__(self, delay_ms: int = 250, parent=None):
+        super().__init__(parent)
+        self.paths = []
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.flush)
+    
+    def add(self, path: str):
+        """Queue a file, restarting the debounce window"""
+        if path not in self.paths:
+            self.paths.append(path)
+        self.timer.start()
+    
+    def flush(self):
+        """Emit everything queued so far as a single batch"""
+        paths, self.paths = self.paths, []
+        if paths:
+            self.ready.emit(paths)
 
 class SearchThrottleTimer(QTimer):
     """Timer for throttling search requests"""
     search_requested = pyqtSignal(str)
     
-    def __init__(self, delay_ms: int = 2000):
+    def __init__(self, delay_ms: int = 250):
         super().__init__()
         self.delay_ms = delay_ms
         self.pending_query = ""
@@ -317,10 +874,16 @@ class AdvancedSettingsDialog(QDialog):
         
         settings_layout.addWidget(QLabel("Search delay (ms):"), 3, 0)
         self.search_delay = QSpinBox()
-        self.search_delay.setRange(500, 5000)
-        self.search_delay.setValue(2000)
+        self.search_delay.setRange(100, 5000)
+        self.search_delay.setValue(250)
         settings_layout.addWidget(self.search_delay, 3, 1)
         
+        settings_layout.addWidget(QLabel("Icon cache (MiB):"), 4, 0)
+        self.icon_cache_size = QSpinBox()
+        self.icon_cache_size.setRange(8, 1024)
+        self.icon_cache_size.setValue(64)
+        settings_layout.addWidget(self.icon_cache_size, 4, 1)
+        
         settings_group.setLayout(settings_layout)
         layout.addWidget(settings_group)
         
@@ -338,16 +901,18 @@ class AdvancedSettingsDialog(QDialog):
         """Load Flatpak remotes"""
         self.remotes_tree.clear()
         try:
-            result = subprocess.run(
-                ['flatpak', 'remotes', '--columns=name,url,options'],
-                capture_output=True, text=True, check=True
-            )
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    parts = line.split('\t')
-                    if len(parts) >= 3:
-                        item = QTreeWidgetItem([parts[0], parts[1], "Yes" if "disabled" not in parts[2] else "No"])
-                        self.remotes_tree.addTopLevelItem(item)
+            with subprocess.Popen(
+                [FLATPAK_BIN, 'remotes', '--columns=name,url,options'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            ) as proc:
+                reader = csv.reader(proc.stdout, delimiter='\t', quoting=csv.QUOTE_NONE)
+                items = [
+                    QTreeWidgetItem([row[0], row[1], "Yes" if "disabled" not in row[2] else "No"])
+                    for row in reader if len(row) >= 3
+                ]
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args)
+            self.remotes_tree.addTopLevelItems(items)
         except Exception as e:
             print(f"Error loading remotes: {e}")
 
@@ -398,33 +963,111 @@ class ErrorDialog(QDialog):
 class FlatpakkyMainWindow(QMainWindow):
     """Main application window"""
     
+    # Sidebar labels mapped to freedesktop main categories used by Flathub
+    category_ids = {
+        "Audio & Video": "AudioVideo",
+        "Development": "Development",
+        "Education": "Education",
+        "Games": "Game",
+        "Graphics & Photography": "Graphics",
+        "Internet": "Network",
+        "Office": "Office",
+        "Science": "Science",
+        "System": "System",
+        "Utilities": "Utility",
+    }
+    
+    # Files flatpak touches whenever an installation changes (user, then system)
+    installation_markers = [
+        os.path.join(
+            os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share')), 'flatpak', '.changed'
+        ),
+        '/var/lib/flatpak/.changed',
+    ]
+    
+    # Update checks (seconds): fallback poll, re-check on focus, and minimum gap
+    update_check_interval = 6 * 60 * 60
+    focus_update_check_gap = 15 * 60
+    min_update_check_gap = 60
+    
     def __init__(self):
         super().__init__()
         self.api = FlatpakAPI()
         self.current_apps = []
+        self.all_apps = []
+        self.apps_by_category = {}
+        self.displayed_apps = None  # List object currently shown in app_list
         self.installed_apps = []
+        self.installed_ids_cache = None  # Backing store for installed_ids
+        self.details_need_refresh = False  # Set when an operation's reload must update the buttons
         self.selected_app = None
-        self.icon_loaders = []
-        self.app_icons = {}
+        self.app_items = {}  # app id -> list row showing it
         self.loading_icons = set()
+        self.failed_icons = set()  # Ids whose icon failed for the current listing
+        self.window_icon = None
         self.tray_icon = None
+        self.cached_updates = 0
+        self.last_update_check = None
+        
+        # Bounded pool for icon downloads, kept apart from app operations
+        self.icon_pool = QThreadPool()
+        self.icon_pool.setMaxThreadCount(IconLoader.max_workers)
+        self.icon_pool.setExpiryTimeout(5000)  # Icon bursts are short; free idle threads quickly
+        self.icon_signals = IconLoaderSignals()
+        self.icon_signals.icon_loaded.connect(self.on_icon_loaded)
+        self.icon_signals.icon_failed.connect(self.on_icon_failed)
         
         # Search throttle timer
-        self.search_timer = SearchThrottleTimer(2000)
+        self.search_timer = SearchThrottleTimer()
         self.search_timer.search_requested.connect(self.perform_search)
+        # Bumped per listing request; replies carrying an older token are stale
+        self.search_token = 0
+        
+        # Short debounce for filtering the already loaded catalog while typing
+        self.filter_timer = QTimer()
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(200)
+        self.filter_timer.timeout.connect(self.apply_local_filter)
+        
+        # .flatpakref files opened together are queued and installed as one batch
+        self.install_queue = PendingInstallQueue(parent=self)
+        self.install_queue.ready.connect(self.install_from_files)
+        self.file_install_processes = {}  # Running install -> output chunks read so far
+        
+        # Tray notifications go out one per tick so bursts don't stall on D-Bus
+        self.notification_queue = deque()
+        self.notification_timer = QTimer()
+        self.notification_timer.setInterval(250)
+        self.notification_timer.timeout.connect(self.show_next_notification)
+        
+        # Coalesce installed-app reloads when several operations finish together
+        self.reload_installed_timer = QTimer()
+        self.reload_installed_timer.setSingleShot(True)
+        self.reload_installed_timer.setInterval(200)
+        self.reload_installed_timer.timeout.connect(self.load_installed_apps)
         
         self.init_ui()
         self.setup_tray_icon()
         self.load_installed_apps()
         self.load_apps()
         
-        # Set up timer for periodic updates
+        # Update checks are driven by installation changes and window focus;
+        # the timer is only a safety net for long idle sessions
+        self.installation_watcher = QFileSystemWatcher()
+        self.installation_watcher.fileChanged.connect(self.on_installation_changed)
+        self.installation_watcher.directoryChanged.connect(self.on_installation_dir_changed)
+        self.watch_installation_markers()
+        
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.check_for_updates)
-        self.update_timer.start(300000)  # Check every 5 minutes
+        self.update_timer.start(self.update_check_interval * 1000)
     
     def get_app_icon(self):
         """Get application icon from logo.png or use default"""
+        # Resolved once; the window, tray and re-created tray share it
+        if self.window_icon is not None:
+            return self.window_icon
+        
         icon_paths = [
             "logo.png",  # Same directory as script
             os.path.join(os.path.dirname(__file__), "logo.png"),  # Explicit path
@@ -433,10 +1076,12 @@ class FlatpakkyMainWindow(QMainWindow):
         
         for path in icon_paths:
             if path and os.path.exists(path):
-                return QIcon(path)
-        
-        # Use default application icon
-        return self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
+                self.window_icon = QIcon(path)
+                break
+        else:
+            # Use default application icon
+            self.window_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
+        return self.window_icon
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -454,6 +1099,10 @@ class FlatpakkyMainWindow(QMainWindow):
         main_layout = QVBoxLayout()
         central_widget.setLayout(main_layout)
         
+        # Shared section heading font (QFont is implicitly shared by Qt)
+        bold_font = QFont()
+        bold_font.setBold(True)
+        
         # Header
         header_layout = QHBoxLayout()
         
@@ -472,7 +1121,7 @@ class FlatpakkyMainWindow(QMainWindow):
         header_layout.addWidget(search_icon)
         
         self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("Search Flathub (auto-search after 2 seconds)")
+        self.search_bar.setPlaceholderText("Search Flathub")
         self.search_bar.textChanged.connect(self.on_search_text_changed)
         self.search_bar.returnPressed.connect(self.search_apps_immediately)
         header_layout.addWidget(self.search_bar)
@@ -496,21 +1145,29 @@ class FlatpakkyMainWindow(QMainWindow):
         
         # Browse Applications
         browse_label = QLabel("Browse Applications")
-        browse_font = QFont()
-        browse_font.setBold(True)
-        browse_label.setFont(browse_font)
+        browse_label.setFont(bold_font)
         left_layout.addWidget(browse_label)
         
         # App list
         self.app_list = QListWidget()
+        self.app_list.setIconSize(QSize(32, 32))
+        # Transparent stand-in so rows keep their height until the icon arrives
+        blank = QPixmap(self.app_list.iconSize())
+        blank.fill(Qt.GlobalColor.transparent)
+        self.blank_icon = QIcon(blank)
+        # Every row is one line of text, so skip per-item size hints and
+        # lay out large listings in chunks instead of all at once
+        self.app_list.setUniformItemSizes(True)
+        self.app_list.setLayoutMode(QListView.LayoutMode.Batched)
         self.app_list.itemSelectionChanged.connect(self.on_app_selected)
+        # Icons are fetched lazily for the rows scrolled into view
+        self.app_list.verticalScrollBar().valueChanged.connect(self.load_visible_icons)
+        self.app_list.verticalScrollBar().rangeChanged.connect(self.load_visible_icons)
         left_layout.addWidget(self.app_list)
         
         # Categories
         categories_label = QLabel("Categories")
-        categories_font = QFont()
-        categories_font.setBold(True)
-        categories_label.setFont(categories_font)
+        categories_label.setFont(bold_font)
         left_layout.addWidget(categories_label)
         
         self.categories_list = QListWidget()
@@ -533,9 +1190,7 @@ class FlatpakkyMainWindow(QMainWindow):
         
         # App details
         details_label = QLabel("App Details")
-        details_font = QFont()
-        details_font.setBold(True)
-        details_label.setFont(details_font)
+        details_label.setFont(bold_font)
         right_layout.addWidget(details_label)
         
         # App details frame
@@ -552,6 +1207,10 @@ class FlatpakkyMainWindow(QMainWindow):
         self.app_icon.setText("Select an app")
         details_layout.addWidget(self.app_icon)
         
+        # Placeholders rendered once and swapped in like any other icon
+        self.loading_pixmap = self.render_placeholder("Loading...")
+        self.no_icon_pixmap = self.render_placeholder("No Icon")
+        
         # App info
         self.app_name = QLabel("Select an app")
         self.app_name.setFont(QFont("", 14, QFont.Weight.Bold))
@@ -618,6 +1277,35 @@ class FlatpakkyMainWindow(QMainWindow):
         # Create menu bar
         self.create_menu_bar()
     
+    def render_placeholder(self, text: str) -> QPixmap:
+        """Draw a centered caption into a transparent icon-sized pixmap"""
+        pixmap = QPixmap(self.app_icon.size())
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setPen(self.app_icon.palette().windowText().color())
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        return pixmap
+    
+    def notify(self, message: str, icon=QSystemTrayIcon.MessageIcon.Information, msecs: int = 3000):
+        """Queue a tray notification; bursts are shown one per throttle tick"""
+        if not (self.tray_icon and self.tray_icon.isVisible()):
+            return
+        if self.notification_timer.isActive():
+            self.notification_queue.append((message, icon, msecs))
+        else:
+            self.tray_icon.showMessage("Flatpakky", message, icon, msecs)
+            self.notification_timer.start()
+    
+    def show_next_notification(self):
+        """Show the oldest queued tray notification, if any"""
+        if not self.notification_queue:
+            self.notification_timer.stop()
+            return
+        message, icon, msecs = self.notification_queue.popleft()
+        if self.tray_icon and self.tray_icon.isVisible():
+            self.tray_icon.showMessage("Flatpakky", message, icon, msecs)
+    
     def setup_tray_icon(self):
         """Set up system tray icon"""
         if not QSystemTrayIcon.isSystemTrayAvailable():
@@ -725,16 +1413,35 @@ class FlatpakkyMainWindow(QMainWindow):
     
     def on_search_text_changed(self, text):
         """Handle search text changes with throttling"""
+        self.filter_timer.start()
         self.search_timer.request_search(text.strip())
     
+    def apply_local_filter(self):
+        """Show loaded apps matching the search text while Flathub is queried"""
+        query = self.search_bar.text().strip().lower()
+        apps = self.all_apps or self.current_apps
+        if query:
+            apps = [
+                app for app in apps
+                if query in app.get('name', app.get('flatpakAppId', '')).lower()
+            ]
+        self.populate_app_list(apps)
+    
     def search_apps_immediately(self):
         """Search apps immediately when Enter is pressed"""
+        self.filter_timer.stop()
         self.search_timer.stop()
         query = self.search_bar.text().strip()
         self.perform_search(query)
     
     def perform_search(self, query: str):
         """Perform the actual search"""
+        if not query and self.all_apps:
+            # Clearing the box returns to the full listing, which is already loaded;
+            # Refresh goes through load_apps directly and still refetches it
+            self.search_token += 1  # Supersede any search still in flight
+            self.on_apps_loaded(self.search_token, query, self.all_apps)
+            return
         self.load_apps(query)
     
     def retry_last_operation(self):
@@ -749,73 +1456,228 @@ class FlatpakkyMainWindow(QMainWindow):
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         self.status_bar.showMessage("Loading applications...")
         
-        # Load apps in a separate thread
-        def load_apps_thread():
-            apps = self.api.search_apps(query)
-            
-            # Update UI in main thread
-            QApplication.instance().processEvents()
-            
-            if not apps and self.api.last_error:
-                # Show error and retry button
-                self.retry_button.setVisible(True)
-                self.status_bar.showMessage(f"Failed to load apps: {self.api.last_error}")
-                self.progress_bar.setVisible(False)
-                
-                # Show error dialog
-                error_dialog = ErrorDialog(
-                    "Connection Error",
-                    "Failed to connect to Flathub. Please check your internet connection.",
-                    self.api.last_error,
-                    self
-                )
-                if error_dialog.exec() == QDialog.DialogCode.Accepted:
-                    self.retry_last_operation()
-                return
-            
-            self.current_apps = apps
-            self.app_list.clear()
-            
-            for app in apps:
-                item = QListWidgetItem()
-                item.setText(app.get('name', app.get('flatpakAppId', 'Unknown')))
+        # Fetch on the thread pool; widgets are only touched in on_apps_loaded
+        self.search_token += 1
+        loader = AppsLoader(query, self.api, self.search_token)
+        loader.signals.apps_loaded.connect(self.on_apps_loaded)
+        loader.signals.apps_failed.connect(self.on_apps_failed)
+        QThreadPool.globalInstance().start(loader)
+    
+    def on_apps_failed(self, token: int, error: str):
+        """Handle a failed Flathub listing request"""
+        if token != self.search_token:
+            return  # A newer search superseded this one
+        
+        # Show error and retry button
+        self.retry_button.setVisible(True)
+        self.status_bar.showMessage(f"Failed to load apps: {error}")
+        self.progress_bar.setVisible(False)
+        
+        # Show error dialog
+        error_dialog = ErrorDialog(
+            "Connection Error",
+            "Failed to connect to Flathub. Please check your internet connection.",
+            error,
+            self
+        )
+        if error_dialog.exec() == QDialog.DialogCode.Accepted:
+            self.retry_last_operation()
+    
+    def on_apps_loaded(self, token: int, query: str, apps: List[Dict]):
+        """Handle apps fetched from Flathub"""
+        if token != self.search_token:
+            return  # A newer search superseded this one
+        
+        self.current_apps = apps
+        if not query:
+            self.all_apps = apps
+        self.build_category_index(apps)
+        self.populate_app_list(apps)
+        
+        self.progress_bar.setVisible(False)
+        self.status_bar.showMessage("Ready")
+    
+    def build_category_index(self, apps: List[Dict]):
+        """Index apps by category so category clicks filter locally"""
+        by_category = defaultdict(list)
+        by_category["All Apps"] = apps
+        for app in apps:
+            for category in app.get('categories') or []:
+                # Flathub returns either plain names or {"name": ...} objects
+                if isinstance(category, dict):
+                    category = category.get('name')
+                if category:
+                    by_category[category].append(app)
+        self.apps_by_category = dict(by_category)
+    
+    def populate_app_list(self, apps: List[Dict]):
+        """Fill the app list and queue icon downloads for it"""
+        # Suspend repaints and selection signals so the insert is one relayout
+        self.app_list.setUpdatesEnabled(False)
+        self.app_list.blockSignals(True)
+        try:
+            rebuilt = not self.update_app_list(apps)
+            if rebuilt:
+                self.app_list.clear()
+                self.app_items = {}
+                for app in apps:
+                    item = self.create_app_item(app)
+                    self.app_list.addItem(item)
+                    self.app_items[app.get('flatpakAppId', '')] = item
+            self.displayed_apps = apps
+        finally:
+            self.app_list.blockSignals(False)
+            self.app_list.setUpdatesEnabled(True)
+        
+        if rebuilt:
+            # Drop downloads still queued for the previous listing; ones already
+            # running will report back and land in the pixmap cache as usual
+            self.icon_pool.clear()
+            self.loading_icons.clear()
+            self.failed_icons.clear()
+        
+        # Wait for the list to lay out before working out which rows are visible
+        QTimer.singleShot(0, self.load_visible_icons)
+    
+    def create_app_item(self, app: Dict) -> QListWidgetItem:
+        """Build the list row for an app, with its icon if already loaded"""
+        app_id = app.get('flatpakAppId', '')
+        item = QListWidgetItem()
+        item.setText(app.get('name', app_id or 'Unknown'))
+        item.setData(Qt.ItemDataRole.UserRole, app)
+        pixmap = QPixmapCache.find(self.icon_cache_key(app_id))
+        item.setIcon(QIcon(pixmap) if pixmap is not None else self.blank_icon)
+        return item
+    
+    def update_app_list(self, apps: List[Dict]) -> bool:
+        """Patch the shown rows into the new listing; False if a rebuild is cheaper"""
+        new_ids = [app.get('flatpakAppId', '') for app in apps]
+        new_id_set = set(new_ids)
+        
+        # Only worth it when most rows survive (e.g. Refresh) and ids are unique;
+        # a filter that shrinks the list is mostly removals, which clear() does faster
+        kept = sum(1 for app_id in new_ids if app_id in self.app_items)
+        removed = len(self.app_items) - kept
+        if not apps or len(new_id_set) != len(new_ids) or kept * 2 < len(new_ids) or removed > kept:
+            return False
+        
+        # Retained rows must already be in the new relative order
+        old_ids = [self.app_list.item(row).data(Qt.ItemDataRole.UserRole).get('flatpakAppId', '')
+                   for row in range(self.app_list.count())]
+        if [app_id for app_id in old_ids if app_id in new_id_set] != \
+                [app_id for app_id in new_ids if app_id in self.app_items]:
+            return False
+        
+        # Drop rows that left the listing, bottom up so row numbers stay valid
+        for row in range(len(old_ids) - 1, -1, -1):
+            if old_ids[row] not in new_id_set:
+                self.app_list.takeItem(row)
+                del self.app_items[old_ids[row]]
+        
+        # Refresh retained rows in place and insert new ones where they belong
+        for row, app in enumerate(apps):
+            app_id = new_ids[row]
+            item = self.app_items.get(app_id)
+            if item is None:
+                item = self.create_app_item(app)
+                self.app_list.insertItem(row, item)
+                self.app_items[app_id] = item
+            else:
+                item.setText(app.get('name', app_id or 'Unknown'))
                 item.setData(Qt.ItemDataRole.UserRole, app)
-                self.app_list.addItem(item)
-                
-                # Load icon if available
-                if 'icon' in app:
-                    self.load_app_icon(app['flatpakAppId'], app['icon'])
-            
-            self.progress_bar.setVisible(False)
-            self.status_bar.showMessage("Ready")
+        return True
+    
+    def load_visible_icons(self):
+        """Queue icons only for the rows currently on screen"""
+        count = self.app_list.count()
+        if not count:
+            return
         
-        # Run in thread
-        thread = threading.Thread(target=load_apps_thread)
-        thread.daemon = True
-        thread.start()
+        viewport_rect = self.app_list.viewport().rect()
+        first = self.app_list.indexAt(viewport_rect.topLeft()).row()
+        if first < 0:
+            # Batched layout hasn't placed any rows yet. Long lists get another
+            # rangeChanged once it has; a list shorter than the viewport never
+            # changes the range, so it is loaded whole now
+            if count * self.app_list.sizeHintForRow(0) > viewport_rect.height():
+                return
+            first, last = 0, count - 1
+        else:
+            last = self.app_list.indexAt(viewport_rect.bottomLeft()).row()
+            if last < 0:
+                last = count - 1  # List ends above the bottom of the viewport
+        
+        icons = []
+        for row in range(first, last + 1):
+            app = self.app_list.item(row).data(Qt.ItemDataRole.UserRole)
+            if 'icon' in app:
+                icons.append((app['flatpakAppId'], app['icon']))
+        self.load_app_icons(icons)
     
     def load_installed_apps(self):
-        """Load installed applications"""
-        self.installed_apps = self.api.get_installed_apps()
+        """Load installed applications in the background"""
+        query = FlatpakQuery(self.api.get_installed_apps)
+        query.signals.finished.connect(self.on_installed_apps_loaded)
+        QThreadPool.globalInstance().start(query)
+    
+    @property
+    def installed_ids(self) -> frozenset:
+        """Ids of installed apps, rebuilt lazily after each installed-list load"""
+        if self.installed_ids_cache is None:
+            self.installed_ids_cache = frozenset(app['flatpakAppId'] for app in self.installed_apps)
+        return self.installed_ids_cache
+    
+    def on_installed_apps_loaded(self, apps: List[Dict]):
+        """Handle installed applications list"""
+        previous_ids = self.installed_ids
+        self.installed_apps = apps
+        self.installed_ids_cache = None
+        changed = self.installed_ids != previous_ids or self.details_need_refresh
+        self.details_need_refresh = False
         self.update_status()
+        
+        # Refresh install/remove buttons only if the selection's state could differ,
+        # or an operation left them disabled waiting for this reload
+        if changed and self.selected_app:
+            self.update_app_details()
+    
+    @staticmethod
+    def icon_cache_key(app_id: str) -> str:
+        """QPixmapCache key for an app icon, kept apart from Qt's own entries"""
+        return f"flatpakky-icon:{app_id}"
     
     def load_app_icon(self, app_id: str, icon_url: str):
         """Load app icon asynchronously"""
-        if app_id in self.app_icons or app_id in self.loading_icons:
-            return
-        
-        self.loading_icons.add(app_id)
-        icon_loader = IconLoader(app_id, icon_url)
-        icon_loader.icon_loaded.connect(self.on_icon_loaded)
-        icon_loader.icon_failed.connect(self.on_icon_failed)
-        icon_loader.start()
-        self.icon_loaders.append(icon_loader)
+        # Jump ahead of any queued listing icons; the user is looking at this one
+        self.load_app_icons([(app_id, icon_url)], priority=1)
     
-    def on_icon_loaded(self, app_id: str, pixmap: QPixmap):
+    def load_app_icons(self, icons: List[Tuple[str, str]], priority: int = 0):
+        """Queue a batch of app icons on the icon thread pool"""
+        for app_id, icon_url in icons:
+            if app_id in self.loading_icons or app_id in self.failed_icons or QPixmapCache.find(self.icon_cache_key(app_id)) is not None:
+                continue
+            
+            # Already decoded icons skip the pool; disk hits are decoded there
+            cached = IconLoader.scaled_cache.get(icon_url)
+            if cached is not None:
+                self.on_icon_loaded(app_id, cached)
+                continue
+            
+            self.loading_icons.add(app_id)
+            self.icon_pool.start(IconLoader(app_id, icon_url, self.api.icon_session, self.icon_signals), priority)
+    
+    def on_icon_loaded(self, app_id: str, image: QImage):
         """Handle icon loaded signal"""
-        self.app_icons[app_id] = pixmap
+        # Convert on the GUI thread; QIcon renders the list size from the 64px source
+        pixmap = QPixmap.fromImage(image)
+        # Bounded by QPixmapCache's limit, unlike a plain dict over a long session
+        QPixmapCache.insert(self.icon_cache_key(app_id), pixmap)
         self.loading_icons.discard(app_id)
         
+        item = self.app_items.get(app_id)
+        if item is not None:
+            item.setIcon(QIcon(pixmap))
+        
         # Update current app display if it matches
         if self.selected_app and self.selected_app.get('flatpakAppId') == app_id:
             self.app_icon.setPixmap(pixmap)
@@ -823,10 +1685,12 @@ class FlatpakkyMainWindow(QMainWindow):
     def on_icon_failed(self, app_id: str):
         """Handle icon loading failure"""
         self.loading_icons.discard(app_id)
+        # Remember it so scrolling doesn't refetch a broken icon on every tick
+        self.failed_icons.add(app_id)
         
         # Update current app display if it matches
         if self.selected_app and self.selected_app.get('flatpakAppId') == app_id:
-            self.app_icon.setText("No Icon")
+            self.app_icon.setPixmap(self.no_icon_pixmap)
     
     def on_app_selected(self):
         """Handle app selection"""
@@ -838,12 +1702,17 @@ class FlatpakkyMainWindow(QMainWindow):
     
     def on_category_selected(self, item):
         """Handle category selection"""
-        category = item.text()
-        if category == "All Apps":
-            self.load_apps()
+        category = self.category_ids.get(item.text(), item.text())
+        if len(self.apps_by_category) <= 1:
+            # Without category metadata there is nothing to filter on
+            apps = self.current_apps
         else:
-            # For now, just load all apps (category filtering would need more API work)
-            self.load_apps()
+            apps = self.apps_by_category.get(category, [])
+        
+        # Re-clicking the current category would rebuild an identical list
+        if apps is self.displayed_apps:
+            return
+        self.populate_app_list(apps)
     
     def update_app_details(self):
         """Update app details panel"""
@@ -859,19 +1728,18 @@ class FlatpakkyMainWindow(QMainWindow):
         self.app_description.setPlainText(app.get('summary', 'No description available'))
         
         # Update app icon
-        if app_id in self.app_icons:
-            self.app_icon.setPixmap(self.app_icons[app_id])
+        pixmap = QPixmapCache.find(self.icon_cache_key(app_id))
+        if pixmap is not None:
+            self.app_icon.setPixmap(pixmap)
         elif app_id in self.loading_icons:
-            self.app_icon.clear()
-            self.app_icon.setText("Loading...")
+            self.app_icon.setPixmap(self.loading_pixmap)
         else:
-            self.app_icon.clear()
-            self.app_icon.setText("No Icon")
+            self.app_icon.setPixmap(self.no_icon_pixmap)
             if 'icon' in app:
                 self.load_app_icon(app_id, app['icon'])
         
         # Update buttons
-        is_installed = any(installed['flatpakAppId'] == app_id for installed in self.installed_apps)
+        is_installed = app_id in self.installed_ids
         self.install_button.setEnabled(not is_installed)
         self.remove_button.setEnabled(is_installed)
         
@@ -880,6 +1748,32 @@ class FlatpakkyMainWindow(QMainWindow):
         else:
             self.install_button.setText("Install")
     
+    def start_worker(self, worker: AppWorker):
+        """Run an app operation on the thread pool and show its progress"""
+        self.worker = worker
+        self.worker.signals.operation_finished.connect(self.on_operation_finished)
+        self.worker.signals.progress_updated.connect(self.status_bar.showMessage)
+        self.worker.signals.progress_percent.connect(self.on_progress_percent)
+        self.worker.signals.batch_progress.connect(self.on_batch_progress)
+        QThreadPool.globalInstance().start(self.worker)
+        
+        # Indeterminate until flatpak reports a percentage
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.resetFormat()
+    
+    def on_progress_percent(self, percent: int):
+        """Switch the progress bar to real progress reported by flatpak"""
+        self.progress_bar.resetFormat()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(percent)
+    
+    def on_batch_progress(self, current: int, total: int, app_id: str):
+        """Show which app of a batch install is underway"""
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(current - 1)
+        self.progress_bar.setFormat(f"{app_id} ({current}/{total})")
+    
     def install_app(self):
         """Install selected app"""
         if not self.selected_app:
@@ -894,13 +1788,7 @@ class FlatpakkyMainWindow(QMainWindow):
         self.remove_button.setEnabled(False)
         
         # Start installation
-        self.worker = AppWorker("install", app_id, self.api)
-        self.worker.operation_finished.connect(self.on_operation_finished)
-        self.worker.progress_updated.connect(self.status_bar.showMessage)
-        self.worker.start()
-        
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
+        self.start_worker(AppWorker("install", app_id, self.api))
     
     def uninstall_app(self):
         """Uninstall selected app"""
@@ -926,58 +1814,53 @@ class FlatpakkyMainWindow(QMainWindow):
         self.remove_button.setEnabled(False)
         
         # Start uninstallation
-        self.worker = AppWorker("uninstall", app_id, self.api)
-        self.worker.operation_finished.connect(self.on_operation_finished)
-        self.worker.progress_updated.connect(self.status_bar.showMessage)
-        self.worker.start()
-        
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
+        self.start_worker(AppWorker("uninstall", app_id, self.api))
     
     def update_all_apps(self):
         """Update all installed apps"""
-        self.worker = AppWorker("update_all", "", self.api)
-        self.worker.operation_finished.connect(self.on_operation_finished)
-        self.worker.progress_updated.connect(self.status_bar.showMessage)
-        self.worker.start()
-        
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
+        self.start_worker(AppWorker("update_all", "", self.api))
         
         # Show tray notification if available
-        if self.tray_icon and self.tray_icon.isVisible():
-            self.tray_icon.showMessage(
-                "Flatpakky", 
-                "Updating all applications...", 
-                QSystemTrayIcon.MessageIcon.Information, 
-                3000
-            )
+        self.notify("Updating all applications...")
     
-    def on_operation_finished(self, success: bool, operation: str):
+    def on_operation_finished(self, success: bool, operation: str, app_ids: List[str], failed: List[str], error: str):
         """Handle operation completion"""
         self.progress_bar.setVisible(False)
+        pretty_op = operation.replace('_', ' ')
+        titled_op = pretty_op.title()
         
         if success:
+            if operation == "update_all":
+                # Everything is current now; no need to ask flatpak again
+                self.cached_updates = 0
+                self.last_update_check = time.monotonic()
+            
             self.status_bar.showMessage(f"Operation completed successfully", 3000)
-            self.load_installed_apps()
-            self.update_app_details()
+            # The buttons stay disabled until the reload; installed_ids is still stale here
+            self.details_need_refresh = True
+            self.reload_installed_timer.start()
             
             # Show tray notification if available
-            if self.tray_icon and self.tray_icon.isVisible():
-                self.tray_icon.showMessage(
-                    "Flatpakky", 
-                    f"{operation.replace('_', ' ').title()} completed successfully!", 
-                    QSystemTrayIcon.MessageIcon.Information, 
-                    3000
-                )
+            self.notify(f"{titled_op} completed successfully!")
         else:
-            self.status_bar.showMessage(f"Operation failed", 3000)
+            if operation == "install_batch":
+                # Partial batches still install something; say how much
+                total = len(app_ids)
+                self.status_bar.showMessage(f"Installed {total - len(failed)} of {total} applications", 5000)
+                if len(failed) < total:
+                    self.details_need_refresh = True
+                    self.reload_installed_timer.start()
+            else:
+                self.status_bar.showMessage(f"Operation failed", 3000)
+            
+            # Re-enable buttons before a possible retry disables them again
+            self.update_app_details()
             
             # Show error dialog with retry option
             error_dialog = ErrorDialog(
                 "Operation Failed",
-                f"The {operation.replace('_', ' ')} operation failed. Please try again.",
-                self.api.last_error or "Unknown error occurred",
+                f"The {pretty_op} operation failed. Please try again.",
+                error or "Unknown error occurred",
                 self
             )
             
@@ -989,33 +1872,31 @@ class FlatpakkyMainWindow(QMainWindow):
                     self.uninstall_app()
                 elif operation == "update_all":
                     self.update_all_apps()
+                elif operation == "install_batch":
+                    self.batch_install_apps(failed)
             
             # Show tray notification if available
-            if self.tray_icon and self.tray_icon.isVisible():
-                self.tray_icon.showMessage(
-                    "Flatpakky", 
-                    f"{operation.replace('_', ' ').title()} failed!", 
-                    QSystemTrayIcon.MessageIcon.Critical, 
-                    3000
-                )
-        
-        # Re-enable buttons
-        if hasattr(self, 'selected_app') and self.selected_app:
-            self.update_app_details()
+            self.notify(f"{titled_op} failed!", QSystemTrayIcon.MessageIcon.Critical)
     
     def refresh_apps(self):
         """Refresh app list"""
+        self.api.invalidate()
         self.load_apps()
         self.load_installed_apps()
     
     def show_advanced_settings(self):
         """Show advanced settings dialog"""
         dialog = AdvancedSettingsDialog(self)
+        dialog.search_delay.setValue(self.search_timer.delay_ms)
+        dialog.icon_cache_size.setValue(QPixmapCache.cacheLimit() // 1024)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             # Apply settings
             if hasattr(dialog, 'search_delay'):
                 self.search_timer.delay_ms = dialog.search_delay.value()
             
+            if hasattr(dialog, 'icon_cache_size'):
+                QPixmapCache.setCacheLimit(dialog.icon_cache_size.value() * 1024)
+            
             if hasattr(dialog, 'enable_tray_check'):
                 if dialog.enable_tray_check.isChecked():
                     if not self.tray_icon:
@@ -1035,91 +1916,178 @@ class FlatpakkyMainWindow(QMainWindow):
                 self.batch_install_apps(app_ids)
     
     def batch_install_apps(self, app_ids: List[str]):
-        """Install multiple apps in batch"""
-        def install_batch():
-            successful = 0
-            failed = 0
-            
-            for i, app_id in enumerate(app_ids):
-                self.status_bar.showMessage(f"Installing {app_id} ({i+1}/{len(app_ids)})...")
-                QApplication.processEvents()
-                
-                if self.api.install_app(app_id):
-                    successful += 1
-                else:
-                    failed += 1
-            
-            self.status_bar.showMessage(f"Batch installation completed: {successful} successful, {failed} failed")
-            self.load_installed_apps()
-            
-            # Show tray notification if available
-            if self.tray_icon and self.tray_icon.isVisible():
-                self.tray_icon.showMessage(
-                    "Flatpakky", 
-                    f"Batch installation completed: {successful} successful, {failed} failed", 
-                    QSystemTrayIcon.MessageIcon.Information, 
-                    5000
-                )
+        """Install multiple apps in a single flatpak transaction"""
+        # Drop duplicates and apps that are already installed
+        app_ids = [app_id for app_id in dict.fromkeys(app_ids) if app_id not in self.installed_ids]
+        if not app_ids:
+            self.status_bar.showMessage("All selected applications are already installed", 3000)
+            return
         
+        self.start_worker(AppWorker("install_batch", "", self.api, app_ids))
+    
+    def install_from_file(self):
+        """Install apps from .flatpakref files"""
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Open Flatpakref Files", "", "Flatpakref Files (*.flatpakref)"
+        )
+        
+        for file_path in file_paths:
+            self.install_queue.add(file_path)
+    
+    def install_from_files(self, file_paths: List[str]):
+        """Install a batch of .flatpakref files, one after another"""
+        # flatpak installs a single ref file per call, so run one process per file
+        self.start_file_install(file_paths, list(file_paths), [])
+    
+    def start_file_install(self, file_paths: List[str], pending: List[str], failures: List[Tuple[str, str]]):
+        """Start the next pending .flatpakref install of a batch"""
+        file_path = pending.pop(0)
+        
+        # QProcess keeps the event loop running for the whole install
+        process = QProcess(self)
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        process.readyReadStandardOutput.connect(lambda: self.on_file_install_output(process))
+        process.finished.connect(
+            lambda: self.on_file_install_finished(process, file_path, file_paths, pending, failures)
+        )
+        process.errorOccurred.connect(
+            lambda error: self.on_file_install_error(process, file_path, file_paths, pending, failures, error)
+        )
+        self.file_install_processes[process] = []
+        process.start(FLATPAK_BIN, ['install', '-y', file_path])
+        
+        self.status_bar.showMessage(f"Installing from file {os.path.basename(file_path)}...")
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
-        
-        thread = threading.Thread(target=install_batch)
-        thread.daemon = True
-        thread.start()
+        self.progress_bar.resetFormat()
     
-    def install_from_file(self):
-        """Install app from .flatpakref file"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Open Flatpakref File", "", "Flatpakref Files (*.flatpakref)"
+    def on_file_install_output(self, process: QProcess):
+        """Show the latest line of a running .flatpakref install"""
+        chunk = bytes(process.readAllStandardOutput())
+        self.file_install_processes[process].append(chunk)
+        
+        # flatpak redraws progress with carriage returns; keep the newest line
+        lines = [line.strip() for line in re.split(r'[\r\n]', chunk.decode(errors='replace')) if line.strip()]
+        if lines:
+            match = AppWorker.percent_pattern.search(lines[-1])
+            if match:
+                self.on_progress_percent(min(int(match.group(1)), 100))
+            self.status_bar.showMessage(lines[-1])
+    
+    def on_file_install_error(self, process: QProcess, file_path: str, file_paths: List[str],
+                              pending: List[str], failures: List[Tuple[str, str]], error: QProcess.ProcessError):
+        """Handle a .flatpakref install that could not be started"""
+        # Other errors (crashes) are followed by finished() and handled there
+        if error == QProcess.ProcessError.FailedToStart:
+            self.on_file_install_finished(process, file_path, file_paths, pending, failures)
+    
+    def on_file_install_finished(self, process: QProcess, file_path: str, file_paths: List[str],
+                                 pending: List[str], failures: List[Tuple[str, str]]):
+        """Record one .flatpakref install and move on to the next in its batch"""
+        success = (
+            process.error() == QProcess.ProcessError.UnknownError
+            and process.exitStatus() == QProcess.ExitStatus.NormalExit
+            and process.exitCode() == 0
         )
+        chunks = self.file_install_processes.pop(process)
+        chunks.append(bytes(process.readAll()))
+        output = b''.join(chunks).decode(errors='replace').strip() or process.errorString()
+        process.deleteLater()
+        
+        if not success:
+            failures.append((file_path, output))
+        if pending:
+            self.start_file_install(file_paths, pending, failures)
+            return
         
-        if file_path:
-            try:
-                subprocess.run(['flatpak', 'install', file_path, '-y'], check=True)
-                self.status_bar.showMessage("Installation from file completed", 3000)
-                self.load_installed_apps()
-                
-                # Show tray notification if available
-                if self.tray_icon and self.tray_icon.isVisible():
-                    self.tray_icon.showMessage(
-                        "Flatpakky", 
-                        "Installation from file completed!", 
-                        QSystemTrayIcon.MessageIcon.Information, 
-                        3000
-                    )
-            except Exception as e:
-                error_dialog = ErrorDialog(
-                    "Installation Failed",
-                    f"Failed to install from file: {os.path.basename(file_path)}",
-                    str(e),
-                    self
-                )
-                error_dialog.exec()
+        # Whole batch done: one reload, one notification
+        self.progress_bar.setVisible(False)
+        if len(failures) < len(file_paths):
+            self.reload_installed_timer.start()
+        
+        if not failures:
+            self.status_bar.showMessage("Installation from file completed", 3000)
+            
+            # Show tray notification if available
+            self.notify("Installation from file completed!")
+        else:
+            installed = len(file_paths) - len(failures)
+            self.status_bar.showMessage(f"Installed {installed} of {len(file_paths)} files", 5000)
+            error_dialog = ErrorDialog(
+                "Installation Failed",
+                f"Failed to install from file: {', '.join(os.path.basename(path) for path, _ in failures)}",
+                "\n\n".join(f"{os.path.basename(path)}:\n{output}" for path, output in failures),
+                self
+            )
+            error_dialog.exec()
     
     def check_for_updates(self):
-        """Check for available updates"""
-        try:
-            result = subprocess.run(
-                ['flatpak', 'remote-ls', '--updates'],
-                capture_output=True, text=True, check=True
-            )
-            updates = len(result.stdout.strip().split('\n')) if result.stdout.strip() else 0
-            self.update_status(updates)
-            
-            # Show tray notification for updates if available
-            if updates > 0 and self.tray_icon and self.tray_icon.isVisible():
-                self.tray_icon.showMessage(
-                    "Flatpakky", 
-                    f"{updates} app updates available!", 
-                    QSystemTrayIcon.MessageIcon.Information, 
-                    5000
-                )
-        except Exception:
-            pass
+        """Check for available updates in the background"""
+        # Nobody can see the result while both the window and tray are hidden
+        tray_visible = self.tray_icon is not None and self.tray_icon.isVisible()
+        if not self.isVisible() and not tray_visible:
+            return
+        
+        # remote-ls hits every remote over the network; don't repeat it too soon
+        now = time.monotonic()
+        if self.last_update_check is not None and now - self.last_update_check < self.min_update_check_gap:
+            return
+        self.last_update_check = now
+        
+        query = FlatpakQuery(self.api.get_update_count)
+        query.signals.finished.connect(self.on_update_count)
+        QThreadPool.globalInstance().start(query)
     
-    def update_status(self, updates: int = 0):
+    def watch_installation_markers(self):
+        """Watch each marker, or its closest existing directory until flatpak creates it"""
+        files = self.installation_watcher.files()
+        directories = self.installation_watcher.directories()
+        for marker in self.installation_markers:
+            if os.path.exists(marker):
+                if marker not in files:
+                    self.installation_watcher.addPath(marker)
+                continue
+            directory = os.path.dirname(marker)
+            while not os.path.isdir(directory) and os.path.dirname(directory) != directory:
+                directory = os.path.dirname(directory)
+            if directory not in directories:
+                self.installation_watcher.addPath(directory)
+                directories.append(directory)
+    
+    def on_installation_changed(self, path: str):
+        """React to flatpak modifying an installation outside the app"""
+        # flatpak rewrites the marker by replacing it, which drops the watch
+        self.watch_installation_markers()
+        
+        self.reload_installed_timer.start()
+        self.check_for_updates()
+    
+    def on_installation_dir_changed(self, path: str):
+        """Switch from a watched directory to its marker once the marker appears"""
+        files = self.installation_watcher.files()
+        if not any(marker not in files and os.path.exists(marker) for marker in self.installation_markers):
+            return  # Unrelated change in the directory
+        
+        directories = self.installation_watcher.directories()
+        if directories:
+            self.installation_watcher.removePaths(directories)
+        self.on_installation_changed(path)
+    
+    def on_update_count(self, updates: Optional[int]):
+        """Handle the result of an update check"""
+        if updates is None:
+            return
+        
+        self.cached_updates = updates
+        self.update_status()
+        
+        # Show tray notification for updates if available
+        if updates > 0:
+            self.notify(f"{updates} app updates available!", msecs=5000)
+    
+    def update_status(self):
         """Update status bar"""
+        updates = self.cached_updates
         installed_count = len(self.installed_apps)
         if updates > 0:
             self.status_bar.showMessage(f"Status: Ready | {installed_count} apps installed | {updates} updates available")
@@ -1151,16 +2119,16 @@ class FlatpakkyMainWindow(QMainWindow):
     
     def changeEvent(self, event):
         """Handle window state changes"""
+        if event.type() == event.Type.ActivationChange and self.isActiveWindow():
+            # Re-check when the user comes back after a while
+            if self.last_update_check is None or time.monotonic() - self.last_update_check >= self.focus_update_check_gap:
+                self.check_for_updates()
+        
         if event.type() == event.Type.WindowStateChange:
             if self.windowState() & Qt.WindowState.WindowMinimized:
                 if self.tray_icon and self.tray_icon.isVisible():
                     self.hide()
-                    self.tray_icon.showMessage(
-                        "Flatpakky", 
-                        "Application minimized to tray", 
-                        QSystemTrayIcon.MessageIcon.Information, 
-                        2000
-                    )
+                    self.notify("Application minimized to tray", msecs=2000)
         super().changeEvent(event)
     
     def closeEvent(self, event):
@@ -1186,17 +2154,25 @@ class FlatpakkyMainWindow(QMainWindow):
     
     def quit_application_cleanup(self):
         """Clean up before quitting"""
-        # Stop all icon loaders
-        for loader in self.icon_loaders:
-            if loader.isRunning():
-                loader.terminate()
-                loader.wait()
+        # Drop queued icon downloads and ask running ones to stop early. Closing
+        # the icon session cuts off what it can; the pool still waits for the
+        # remaining requests when it is destroyed, at most IconLoader.timeout
+        IconLoader.cancelled.set()
+        self.icon_pool.clear()
+        self.api.icon_session.close()
+        self.icon_pool.waitForDone(200)
         
         # Stop timers
         if hasattr(self, 'update_timer'):
             self.update_timer.stop()
         if hasattr(self, 'search_timer'):
             self.search_timer.stop()
+        if hasattr(self, 'filter_timer'):
+            self.filter_timer.stop()
+        if hasattr(self, 'reload_installed_timer'):
+            self.reload_installed_timer.stop()
+        if hasattr(self, 'notification_timer'):
+            self.notification_timer.stop()
         
         # Hide tray icon
         if self.tray_icon:
@@ -1205,6 +2181,9 @@ class FlatpakkyMainWindow(QMainWindow):
 class FlatpakkyApp(QApplication):
     """Main application class"""
     
+    # Resolved logo, shared by every instance once looked up
+    cached_icon: Optional[QIcon] = None
+    
     def __init__(self, argv):
         super().__init__(argv)
         self.setApplicationName("Flatpakky")
@@ -1217,22 +2196,26 @@ class FlatpakkyApp(QApplication):
         # Set application style
         self.setStyle('Fusion')
         
+        # Budget for decoded app icons (KiB); least recently used ones are evicted
+        QPixmapCache.setCacheLimit(64 * 1024)
+        
         # Handle .flatpakref files
-        if len(argv) > 1 and argv[1].endswith('.flatpakref'):
-            self.flatpakref_file = argv[1]
-        else:
-            self.flatpakref_file = None
+        self.flatpakref_files = [arg for arg in argv[1:] if arg.endswith('.flatpakref')]
         
         # Create main window
         self.main_window = FlatpakkyMainWindow()
         self.main_window.show()
         
-        # Handle flatpakref file if provided
-        if self.flatpakref_file:
-            self.handle_flatpakref_file()
+        # Handle flatpakref files if provided
+        if self.flatpakref_files:
+            self.handle_flatpakref_files()
     
-    def get_app_icon(self):
+    @classmethod
+    def get_app_icon(cls):
         """Get application icon from logo.png or use default"""
+        if cls.cached_icon is not None:
+            return cls.cached_icon
+        
         icon_paths = [
             "logo.png",  # Same directory as script
             os.path.join(os.path.dirname(__file__), "logo.png"),  # Explicit path
@@ -1241,41 +2224,71 @@ class FlatpakkyApp(QApplication):
         
         for path in icon_paths:
             if path and os.path.exists(path):
-                return QIcon(path)
-        
-        # Use default application icon
-        return QIcon()
+                cls.cached_icon = QIcon(path)
+                break
+        else:
+            # Use default application icon
+            cls.cached_icon = QIcon()
+        return cls.cached_icon
     
-    def handle_flatpakref_file(self):
-        """Handle .flatpakref file passed as argument"""
+    def handle_flatpakref_files(self):
+        """Handle .flatpakref files passed as arguments"""
         reply = QMessageBox.question(
             self.main_window, 'Install Application',
-            f'Do you want to install the application from {self.flatpakref_file}?',
+            f'Do you want to install the application from {", ".join(self.flatpakref_files)}?',
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
         if reply == QMessageBox.StandardButton.Yes:
+            for path in self.flatpakref_files:
+                self.main_window.install_queue.add(path)
+
+class MimeRegisterTask(QRunnable):
+    """Thread pool task registering Flatpakky as the .flatpakref handler"""
+    
+    def run(self):
+        try:
+            desktop_dir = os.path.expanduser("~/.local/share/applications")
+            desktop_file_path = os.path.join(desktop_dir, "flatpakky.desktop")
+            
             try:
-                subprocess.run(['flatpak', 'install', self.flatpakref_file, '-y'], check=True)
-                QMessageBox.information(self.main_window, "Success", "Application installed successfully!")
-                self.main_window.load_installed_apps()
-            except Exception as e:
-                error_dialog = ErrorDialog(
-                    "Installation Failed",
-                    f"Failed to install from {os.path.basename(self.flatpakref_file)}",
-                    str(e),
-                    self.main_window
-                )
-                error_dialog.exec()
+                with open(desktop_file_path) as f:
+                    existing_content = f.read()
+            except FileNotFoundError:
+                existing_content = None
+            
+            # Only rewrite the entry and rebuild the MIME cache when it changed
+            if existing_content != DESKTOP_FILE_CONTENT:
+                os.makedirs(desktop_dir, exist_ok=True)
+                
+                # Write a unique file beside the target and rename so a crash never
+                # leaves a truncated entry and concurrent launches can't clobber
+                # each other; no fsync, the file is regenerated next launch
+                tmp = tempfile.NamedTemporaryFile('w', dir=desktop_dir, suffix='.tmp', delete=False)
+                try:
+                    with tmp:
+                        tmp.write(DESKTOP_FILE_CONTENT)
+                    # NamedTemporaryFile creates 0600; desktop entries are world-readable
+                    os.chmod(tmp.name, 0o644)
+                    os.replace(tmp.name, desktop_file_path)
+                except OSError:
+                    os.unlink(tmp.name)
+                    raise
+                
+                # Update MIME database; skip the fork where the tool isn't installed
+                update_tool = shutil.which('update-desktop-database')
+                if update_tool:
+                    subprocess.run([update_tool, desktop_dir], capture_output=True)
+            
+        except Exception as e:
+            print(f"Warning: Could not set up MIME type association: {e}")
 
 def main():
     """Main entry point"""
     import sys
     
     # Check if flatpak is available
-    try:
-        subprocess.run(['flatpak', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if FLATPAK_BIN is None:
         print("Error: Flatpak is not installed or not available in PATH")
         print("Please install Flatpak first:")
         print("  Ubuntu/Debian: sudo apt install flatpak")
@@ -1286,31 +2299,8 @@ def main():
     # Create and run application
     app = FlatpakkyApp(sys.argv)
     
-    # Set up MIME type handling for .flatpakref files
-    try:
-        # Create .desktop file for MIME type association
-        desktop_file_content = """[Desktop Entry]
-Name=Flatpakky
-Comment=Flathub browser for Flatpaks
-Exec=python3 {script_path} %f
-Icon=application-x-flatpakref
-Terminal=false
-Type=Application
-MimeType=application/vnd.flatpak.ref;
-Categories=System;PackageManager;
-""".format(script_path=os.path.abspath(__file__))
-        
-        desktop_dir = os.path.expanduser("~/.local/share/applications")
-        os.makedirs(desktop_dir, exist_ok=True)
-        
-        with open(os.path.join(desktop_dir, "flatpakky.desktop"), 'w') as f:
-            f.write(desktop_file_content)
-        
-        # Update MIME database
-        subprocess.run(['update-desktop-database', desktop_dir], capture_output=True)
-        
-    except Exception as e:
-        print(f"Warning: Could not set up MIME type association: {e}")
+    # Register the .flatpakref MIME handler without delaying the first paint
+    QThreadPool.globalInstance().start(MimeRegisterTask())
     
     sys.exit(app.exec())
 
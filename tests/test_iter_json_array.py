@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from flatpakky import FlatpakAPI
+
+
+class ChunkedResponse:
+    """Stand-in for a streamed requests.Response with a fixed chunk size"""
+    
+    def __init__(self, body: bytes, size: int):
+        self.chunks = [body[i:i + size] for i in range(0, len(body), size)]
+    
+    def iter_content(self, chunk_size):
+        return iter(self.chunks)
+
+
+BODIES = [
+    b'[1500.0]',
+    b'[1, 23, -4.5e+3, 6E2]',
+    b'[ {"flatpakAppId": "org.example.App", "rating": 4.25}, "\xc3\xa9t\xc3\xa9", null, true ]',
+    b'[]',
+]
+
+
+@pytest.mark.parametrize("body", BODIES)
+def test_any_chunk_size_yields_the_same_elements(body):
+    expected = json.loads(body)
+    for size in range(1, len(body) + 1):
+        assert list(FlatpakAPI.iter_json_array(ChunkedResponse(body, size))) == expected, size
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5])
+def test_truncated_array_raises(size):
+    with pytest.raises(ValueError):
+        list(FlatpakAPI.iter_json_array(ChunkedResponse(b'[1, 2', size)))